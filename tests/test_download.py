@@ -1,3 +1,16 @@
 def test_daily(tranco):
     l = tranco.list(date="2024-01-01")
     assert l.list_id == "V929N"
+
+
+def test_list_ids_for_dates(tranco):
+    dates = ["2024-01-01", "2024-01-02", "2024-01-03"]
+    list_ids = tranco.list_ids_for_dates(dates)
+    assert list_ids[0] == "V929N"
+    assert list_ids == [tranco._get_list_id_for_date(date) for date in dates]
+    assert list_ids[::-1] == tranco.list_ids_for_dates(dates[::-1])
+    assert tranco.list_ids_for_dates(["2024-01-01", "2024-01-02"], subdomains=True)[0] == "G6Y6K"
+
+
+def test_list_ids_for_dates_empty(tranco):
+    assert tranco.list_ids_for_dates([]) == []
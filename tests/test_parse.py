@@ -0,0 +1,29 @@
+from tranco.tranco import Tranco
+
+
+def test_parse_line_split_across_chunks():
+    assert Tranco._parse_list_chunks([b"1,google.c", b"om\n2,a.org\n"]) == ["google.com", "a.org"]
+
+
+def test_parse_crlf():
+    assert Tranco._parse_list_chunks([b"1,google.com\r\n2,a.org\r", b"\n3,b.net\r\n"]) == ["google.com", "a.org", "b.net"]
+
+
+def test_parse_no_final_newline():
+    assert Tranco._parse_list_chunks([b"1,google.com\n2,a.org"]) == ["google.com", "a.org"]
+
+
+def test_parse_empty():
+    assert Tranco._parse_list_chunks([]) == []
+    assert Tranco._parse_list_chunks([b""]) == []
+
+
+def test_parse_only_splits_on_newline():
+    assert Tranco._parse_list_chunks([b"1,a.com\x0c\n2,b\xc2\x85.com\n"]) == ["a.com\x0c", "b\x85.com"]
+
+
+def test_parse_limit():
+    chunks = [b"1,google.com\n2,a.org\n", b"3,b.net\n4,c.de"]
+    assert Tranco._parse_list_chunks(chunks, 3) == ["google.com", "a.org", "b.net"]
+    assert Tranco._parse_list_chunks(chunks, 1) == ["google.com"]
+    assert Tranco._parse_list_chunks(chunks, 10) == ["google.com", "a.org", "b.net", "c.de"]
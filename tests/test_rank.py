@@ -7,3 +7,8 @@ def test_domain_rank(tranco_list):
 
 def test_domain_not_in_list_rank(tranco_list):
     assert tranco_list.rank(f"domaindoesntexist{uuid.uuid4().hex.upper()[0:6]}.com") == -1
+
+
+def test_rank_many(tranco_list):
+    top_3 = tranco_list.top(3)
+    assert tranco_list.rank_many(top_3 + [f"domaindoesntexist{uuid.uuid4().hex.upper()[0:6]}.com"]) == [1, 2, 3, -1]
@@ -1,17 +1,20 @@
 import json
 import os
 import platform
+import tempfile
 import zipfile
-from datetime import datetime, timedelta
-from io import BytesIO
-from itertools import islice
-from typing import Dict, List, Optional, Tuple, Any
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta, timezone
+from functools import partial
+from itertools import repeat
+from typing import Dict, Iterable, List, Sequence, Optional, Tuple, Any
 
 import requests
 from warnings import warn
 from enum import IntEnum
 
 VERSION = '0.8.1'
+MAX_CONCURRENT_REQUESTS = 8
 
 
 class TrancoList:
@@ -19,14 +22,25 @@ class TrancoList:
         self.date: str = date
         self.list_id: str = list_id
         self.list_page: str = "https://tranco-list.eu/list/{}/".format(list_id)
-        self.list: Dict[str, int] = {domain: index for index, domain in enumerate(lst, start=1)}
+        self._domains: List[str] = lst
+        self._rank_index: Optional[Dict[str, int]] = None
+
+    @property
+    def list(self) -> Dict[str, int]:
+        # Mapping of domain to rank, only built once a lookup needs it
+        if self._rank_index is None:
+            self._rank_index = dict(zip(self._domains, range(1, len(self._domains) + 1)))
+        return self._rank_index
 
     def top(self, num: int = 1000000) -> List[str]:
-        return sorted(self.list, key=self.list.get)[:num]
+        return self._domains[:num]
 
     def rank(self, domain: str) -> int:
         return self.list.get(domain, -1)
 
+    def rank_many(self, domains: Sequence[str]) -> List[int]:
+        return list(map(self.list.get, domains, repeat(-1)))
+
 
 class TrancoCacheType(IntEnum):
     NOT_CACHED = 0
@@ -51,8 +65,11 @@ class Tranco:
             self.cache_dir = os.path.join(cwd, '.tranco')
         if not os.path.exists(self.cache_dir):
             os.mkdir(self.cache_dir)
+        self._metadata_path: str = os.path.join(self.cache_dir, 'metadata.json')
+        self._path_cache: Dict[str, str] = {}
         self.cache_metadata: Dict[str, TrancoCacheType] = {}
         self._load_cache_metadata()
+        self._last_list: Optional[Tuple[str, bool, List[str]]] = None  # (list_id, full, domains) of the last parsed list
 
         self.account_email: str = kwargs.get('account_email')
         self.api_key: str = kwargs.get('api_key')
@@ -75,19 +92,28 @@ class Tranco:
             }
 
         self.session = requests.Session()
+        # Keep one pooled keep-alive connection per concurrent request, reused across calls
+        adapter = requests.adapters.HTTPAdapter(pool_maxsize=MAX_CONCURRENT_REQUESTS)
+        self.session.mount('https://', adapter)
+        self.session.mount('http://', adapter)
         self.session.headers.update({'User-Agent': f'Python/{platform.python_version()} requests/{requests.__version__} tranco-python/{VERSION}'})
         if self.proxies:
             self.session.proxies.update(self.proxies)
 
     def _cache_metadata_path(self) -> str:
-        return os.path.join(self.cache_dir, 'metadata.json')
+        return self._metadata_path
 
     def _cache_path(self, list_id) -> str:
-        return os.path.join(self.cache_dir, f'{list_id}.csv')
+        path = self._path_cache.get(list_id)
+        if path is None:
+            path = self._path_cache[list_id] = os.path.join(self.cache_dir, f'{list_id}.csv')
+        return path
 
     def _load_cache_metadata(self) -> None:
         if not os.path.exists(self._cache_metadata_path()):
+            self.cache_metadata = {}
             self._write_cache_metadata()
+            return
         with open(self._cache_metadata_path(), "rt") as f:
             self.cache_metadata = json.load(f)
 
@@ -119,7 +145,9 @@ class Tranco:
     def clear_cache(self) -> None:
         for f in os.listdir(self.cache_dir):
             os.remove(os.path.join(self.cache_dir, f))
-        self._load_cache_metadata()
+        self._last_list = None
+        self.cache_metadata = {}
+        self._write_cache_metadata()
 
     def list(self, date: Optional[str] = None, list_id: Optional[str] = None, subdomains: bool = False,
              full: bool = False) -> TrancoList:
@@ -139,19 +167,32 @@ class Tranco:
 
         if not list_id:
             if (not date) or (date == 'latest'):  # no arguments given: default to latest list
-                yesterday = (datetime.utcnow() - timedelta(days=1))
-                date = yesterday.strftime('%Y-%m-%d')
+                date = (datetime.now(timezone.utc).date() - timedelta(days=1)).isoformat()
             list_id = self._get_list_id_for_date(date, subdomains=subdomains)
 
+        if self._last_list is not None:
+            last_list_id, last_full, domains = self._last_list
+            if last_list_id == list_id and (last_full or not full):  # a full list also holds the top million
+                return TrancoList(date, list_id, domains if full else domains[:1000000])
+
         if not self._is_cached(list_id, full):
-            self._download_file(list_id, full)  # download list and load into cache
-        with open(self._cache_path(list_id)) as f:  # read list from cache
-            if full:
-                top_list_lines = f.read().splitlines()
-            else:
-                top_list_lines = [line.rstrip() for line in islice(f, 1000000)]
+            domains = self._download_file(list_id, full)  # download list, load into cache and parse it
+        else:
+            with open(self._cache_path(list_id), 'rb') as f:  # read list from cache
+                domains = self._parse_list_chunks(iter(partial(f.read, 1 << 20), b''), None if full else 1000000)
+
+        self._last_list = (list_id, full, domains)
+        return TrancoList(date, list_id, domains)
 
-        return TrancoList(date, list_id, list(map(lambda x: x[x.index(',') + 1:], top_list_lines)))
+    def list_ids_for_dates(self, dates: List[str], subdomains: bool = False) -> List[str]:
+        """
+        Retrieve the IDs of the daily lists for several dates, querying them concurrently.
+        :param dates: Dates (in the format YYYY-MM-DD) for which to get the daily list ID.
+        :param subdomains: Include subdomains in the lists. Default: False.
+        :return: List IDs, in the same order as `dates`.
+        """
+        with ThreadPoolExecutor(max_workers=MAX_CONCURRENT_REQUESTS) as executor:
+            return list(executor.map(partial(self._get_list_id_for_date, subdomains=subdomains), dates))
 
     def _get_list_id_for_date(self, date: str, subdomains: bool = False) -> str:
         response = self.session.get(
@@ -163,46 +204,102 @@ class Tranco:
         else:
             raise AttributeError("The daily list for this date is currently unavailable.")
 
-    def _download_file(self, list_id: str, full: bool = False) -> None:
+    def _download_file(self, list_id: str, full: bool = False) -> List[str]:
         if full:
-            self._download_full_file(list_id)
+            domains = self._download_full_file(list_id)
         else:
-            self._download_zip_file(list_id)
+            domains = self._download_zip_file(list_id)
         self._add_to_cache(list_id, full)
+        return domains
 
-    def _download_zip_file(self, list_id: str) -> None:
+    def _write_list_file(self, list_id: str, chunks: Iterable[bytes]) -> List[str]:
+        """
+        Write the downloaded CSV to the cache, parsing the domains in the same pass
+        so that the list does not need to be read back from disk.
+        :param list_id: ID of the list being written
+        :param chunks: raw CSV contents
+        :return: domains of the list, in rank order
+        """
+        path = self._cache_path(list_id)
+        tmp_path = path + '.tmp'  # only replace the cached list once it has been written completely
+        try:
+            with open(tmp_path, 'wb', buffering=1 << 20) as f:
+                def written_chunks():
+                    for chunk in chunks:
+                        f.write(chunk)
+                        yield chunk
+                domains = self._parse_list_chunks(written_chunks())
+            os.replace(tmp_path, path)
+        except BaseException:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+            raise
+        return domains
+
+    @staticmethod
+    def _parse_list_chunks(chunks: Iterable[bytes], limit: Optional[int] = None) -> List[str]:
+        """
+        Parse the domains from a CSV list given as consecutive chunks of bytes.
+        :param chunks: raw CSV contents
+        :param limit: maximum number of domains to parse, default: all
+        :return: domains of the list, in rank order
+        """
+        domains: List[str] = []
+        rest = b''
+        for chunk in chunks:
+            buf = rest + chunk
+            cut = buf.rfind(b'\n') + 1  # only parse complete lines, carry the remainder over
+            rest = buf[cut:]
+            lines = buf[:cut].decode().split('\n')
+            lines.pop()  # empty string after the final newline
+            domains.extend(line.partition(',')[2].rstrip('\r') for line in lines)
+            if limit is not None and len(domains) >= limit:
+                del domains[limit:]
+                return domains
+        if rest.strip():
+            domains.append(rest.decode().partition(',')[2].rstrip('\r'))
+        if limit is not None:
+            del domains[limit:]
+        return domains
+
+    def _download_zip_file(self, list_id: str) -> List[str]:
         download_url = f'https://tranco-list.eu/download_daily/{list_id}'
-        response = self.session.get(download_url, proxies=self.proxies, stream=True)
-        if response.status_code == 200:
-            with zipfile.ZipFile(BytesIO(response.content)) as z:
-                with z.open('top-1m.csv') as csvf:
-                    file_bytes = csvf.read()
-                    with open(self._cache_path(list_id), 'wb') as f:
-                        f.write(file_bytes)
-        elif response.status_code == 403:
-            # List not available as ZIP file
-            download_url = f'https://tranco-list.eu/download/{list_id}/1000000'
-            response2 = self.session.get(download_url, proxies=self.proxies)
+        with self.session.get(download_url, proxies=self.proxies, stream=True) as response:
+            if response.status_code == 200:
+                with tempfile.TemporaryFile(buffering=1 << 20) as archive:  # spool the archive to disk instead of memory
+                    for chunk in response.iter_content(chunk_size=1 << 16):
+                        archive.write(chunk)
+                    with zipfile.ZipFile(archive) as z:
+                        with z.open('top-1m.csv') as csvf:
+                            return self._write_list_file(list_id, iter(partial(csvf.read, 1 << 20), b''))
+            elif response.status_code == 403:
+                # List not available as ZIP file
+                pass
+            elif response.status_code == 502:
+                # List unavailable (bad gateway)
+                raise AttributeError("This list is currently unavailable.")
+            else:
+                # List unavailable (non-success status code)
+                raise AttributeError("The daily list for this date is currently unavailable.")
+
+        download_url = f'https://tranco-list.eu/download/{list_id}/1000000'
+        with self.session.get(download_url, proxies=self.proxies, stream=True) as response2:
             if response2.status_code == 200:
-                file_bytes = response2.content
-                with open(self._cache_path(list_id), 'wb') as f:
-                    f.write(file_bytes)
+                return self._write_list_file(list_id, response2.iter_content(chunk_size=1 << 20))
             else:
                 raise AttributeError("The daily list for this date is currently unavailable.")
-        elif response.status_code == 502:
-            # List unavailable (bad gateway)
-            raise AttributeError("This list is currently unavailable.")
-        else:
-            # List unavailable (non-success status code)
-            raise AttributeError("The daily list for this date is currently unavailable.")
 
-    def _download_full_file(self, list_id: str) -> None:
+    def _download_full_file(self, list_id: str) -> List[str]:
         download_url = f'https://tranco-list.eu/download/{list_id}/full'
-        response = self.session.get(download_url, proxies=self.proxies)
-        if response.status_code == 200:
-            file_bytes = response.content
-            with open(self._cache_path(list_id), 'wb') as f:
-                f.write(file_bytes)
+        with self.session.get(download_url, proxies=self.proxies, stream=True) as response:
+            if response.status_code == 200:
+                return self._write_list_file(list_id, response.iter_content(chunk_size=1 << 20))
+            elif response.status_code == 502:
+                # List unavailable (bad gateway)
+                raise AttributeError("This list is currently unavailable.")
+            else:
+                # List unavailable (non-success status code)
+                raise AttributeError("The full list is currently unavailable.")
 
     def configure(self, configuration: Dict[str, Any]) -> Tuple[bool, str]:
         """